@@ -18,8 +18,29 @@ Examples:
 Drew Troxell
 """
 
+import functools
 import os.path
-import yapf
+import textwrap
+import weakref
+
+_INDENT = '    '
+_DEFAULT_EXTENDS = ('object',)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_code(code):
+    """Format Python source with YAPF, reusing results for repeated source.
+
+    YAPF is imported on first use so building blocks does not pay for it.
+
+    Args:
+        code (str): The unformatted Python source.
+
+    Returns:
+        str: The formatted Python source.
+    """
+    from yapf.yapflib.yapf_api import FormatCode
+    return FormatCode(code)[0]
 
 
 class FormattedBlock(object):
@@ -28,14 +49,26 @@ class FormattedBlock(object):
     Provides magic methods and interface for CodeBlock and DocString.
     """
 
+    __slots__ = ('_cached_str', '_formatted_lines', '_lines_cache', '_parents',
+                 '_in_cache', '__weakref__')
+
+    def __init__(self):
+        """Initialize a FormattedBlock."""
+        self._cached_str = None
+        self._formatted_lines = None
+        self._lines_cache = None
+        self._parents = None
+        self._in_cache = False
+
     def __str__(self):
         """String representation of a codeblock is the formatted code.
 
+        The formatted code is kept until the block changes.
+
         Returns:
             str: The formatted code as a string.
         """
-        code = '\n'.join(self._to_lines())
-        return yapf.yapf_api.FormatCode(code)[0]
+        return self._ensure_formatted()._cached_str
 
     def __iter__(self):
         """Convert this CodeBlock to an iterable of code lines.
@@ -43,7 +76,9 @@ class FormattedBlock(object):
         Returns:
             list(str): List of formatted lines of code.
         """
-        return iter(self._to_lines())
+        if self._ensure_formatted()._formatted_lines is None:
+            self._formatted_lines = self._cached_str.split('\n')
+        return iter(self._formatted_lines)
 
     def __len__(self):
         """# of lines in a CodeBlock.
@@ -51,24 +86,170 @@ class FormattedBlock(object):
         Returns:
             int: The number of lines in the CodeBlock after formatting.
         """
-        return len(self._to_lines())
+        return self._ensure_formatted()._cached_str.count('\n') + 1
 
     def __contains__(self, item):
         """Test membership of a string in a CodeBlock.
 
+        A single search over the formatted code, so an item containing a
+        newline can match across lines.
+
         Returns:
-            bool: True if item is present in any line of the formatted CodeBlock.
+            bool: True if item is present in the formatted CodeBlock.
         """
-        return any(item in l for l in list(self))
+        return item in self._ensure_formatted()._cached_str
 
     def __eq__(self, other):
         """Test equality of two CodeBlocks.
 
+        Blocks that are both already formatted compare their cached code.
+        Otherwise identical unformatted source is equal without running
+        YAPF, and differing source falls back to comparing formatted code.
+
         Returns:
             bool: True if equal.
         """
+        if isinstance(other, FormattedBlock):
+            if self._cached_str is not None and other._cached_str is not None:
+                return self._cached_str == other._cached_str
+            if self.raw_str() == other.raw_str():
+                return True
         return str(self) == str(other)
 
+    def raw_str(self):
+        """The unformatted code of this block, without running YAPF.
+
+        Returns:
+            str: The code lines joined with newlines.
+        """
+        return '\n'.join(self._to_lines())
+
+    def _ensure_formatted(self):
+        """Format this block unless its formatted code is already cached.
+
+        Returns:
+            FormattedBlock: This FormattedBlock.
+        """
+        if self._cached_str is None:
+            self._cached_str = _format_code(self.raw_str())
+        return self
+
+    def __getstate__(self):
+        """Get the state to pickle or copy, leaving out caches and parents.
+
+        Returns:
+            dict: The attributes declared in sub-class __slots__.
+        """
+        state = {}
+        for cls in type(self).__mro__:
+            if cls is FormattedBlock:
+                break
+            for name in cls.__slots__:
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled or copied block and relink its children.
+
+        Args:
+            state (dict): The state from __getstate__.
+        """
+        FormattedBlock.__init__(self)
+        for name, value in state.items():
+            setattr(self, name, value)
+        for child in self._children():
+            child._add_parent(self)
+
+    def _children(self):
+        """The blocks rendered as part of this one.
+
+        Returns:
+            list(FormattedBlock): The child blocks.
+        """
+        return []
+
+    def _add_parent(self, parent):
+        """Record a block containing this one, without keeping it alive.
+
+        A single parent is kept as a bare weak reference. More parents are
+        kept in a dict keyed by id, which is swept of dead references each
+        time it doubles in size.
+
+        Args:
+            parent (CodeBlock): The block this one is part of.
+        """
+        parents = self._parents
+        if parents is None:
+            self._parents = weakref.ref(parent)
+            return
+        if type(parents) is not dict:
+            first = parents()
+            if first is parent:
+                return
+            parents = {} if first is None else {id(first): parents}
+            self._parents = parents
+        ref = parents.get(id(parent))
+        if ref is None or ref() is not parent:
+            parents[id(parent)] = weakref.ref(parent)
+            size = len(parents)
+            if size >= 8 and size & (size - 1) == 0:
+                for key, ref in list(parents.items()):
+                    if ref() is None:
+                        del parents[key]
+
+    def _remove_parent(self, parent):
+        """Forget a block that no longer contains this one.
+
+        Args:
+            parent (CodeBlock): The block this one was removed from.
+        """
+        parents = self._parents
+        if parents is None:
+            return
+        if type(parents) is dict:
+            ref = parents.get(id(parent))
+            if ref is not None and ref() is parent:
+                del parents[id(parent)]
+        elif parents() is parent:
+            self._parents = None
+
+    def _live_parents(self):
+        """The blocks still alive that contain this one.
+
+        Returns:
+            list(CodeBlock): The parent blocks.
+        """
+        parents = self._parents
+        if parents is None:
+            return []
+        if type(parents) is not dict:
+            parent = parents()
+            return [] if parent is None else [parent]
+        live = [ref() for ref in list(parents.values())]
+        return [parent for parent in live if parent is not None]
+
+    def _invalidate(self):
+        """Drop the rendered code of this block and of its parents.
+
+        Rendering flags every block it covers. The walk stops at blocks
+        that are not flagged, since none of their ancestors can be holding
+        their code, so changing an unrendered tree costs nothing.
+        """
+        if not self._in_cache:
+            return
+        pending = [self]
+        while pending:
+            block = pending.pop()
+            if not block._in_cache:
+                continue
+            block._in_cache = False
+            block._lines_cache = None
+            block._cached_str = None
+            block._formatted_lines = None
+            if block._parents is not None:
+                pending.extend(block._live_parents())
+
     def _to_lines(self):
         raise NotImplementedError()
 
@@ -79,11 +260,16 @@ class CodeBlock(FormattedBlock):
     Don't use this class directly, use the sub-classes.
     """
 
+    __slots__ = ('_docstring', '_return_stmnt', '_statements')
+
+    _body_indent = _INDENT
+
     def __init__(self):
         """Initialize a CodeBlock."""
+        super().__init__()
         self._docstring = None
-        self.return_stmnt = None
-        self.statements = []
+        self._return_stmnt = None
+        self._statements = []
 
     def _entry(self):
         """The entry line to this code block.
@@ -109,11 +295,64 @@ class CodeBlock(FormattedBlock):
         """
         if not isinstance(docstring, DocString):
             raise TypeError("'docstring' must be of type DocString")
+        if self._docstring is not None:
+            self._docstring._remove_parent(self)
+        docstring._add_parent(self)
         self._docstring = docstring
+        self._invalidate()
+
+    @property
+    def statements(self):
+        """Get the Statements and CodeBlocks in the body of this CodeBlock.
+
+        Add to the body with append() so cached output is refreshed.
+        """
+        return self._statements
+
+    @statements.setter
+    def statements(self, statements):
+        """Replace the body of this CodeBlock.
+
+        Args:
+            statements (list(CodeBlock|str)): The new body. Strings are
+                wrapped in Statement CodeBlocks, as in append().
+        """
+        body = []
+        for stmnt in statements:
+            if isinstance(stmnt, str):
+                stmnt = Statement(stmnt)
+            elif not isinstance(stmnt, CodeBlock):
+                raise TypeError("statements should be of type CodeBlock or str.")
+            body.append(stmnt)
+        for stmnt in self._statements:
+            if isinstance(stmnt, CodeBlock):
+                stmnt._remove_parent(self)
+        for stmnt in body:
+            stmnt._add_parent(self)
+        self._statements = body
+        self._invalidate()
+
+    @property
+    def return_stmnt(self):
+        """Get the return statement ending this CodeBlock, if any."""
+        return self._return_stmnt
+
+    @return_stmnt.setter
+    def return_stmnt(self, return_stmnt):
+        """Set the return statement ending this CodeBlock.
+
+        Args:
+            return_stmnt (str): The return statement, or None for none.
+        """
+        self._return_stmnt = return_stmnt
+        self._invalidate()
 
     def append(self, codeblock):
         """Append a Statement or CodeBlock to this CodeBlock.
 
+        The CodeBlock is kept by reference, so later changes to it show up
+        when this CodeBlock is rendered.
+
         Args:
             codeblock (CodeBlock|str): The item to append to this CodeBlock.
                 If this is a string, it is wrapped in a Statement CodeBlock.
@@ -122,27 +361,73 @@ class CodeBlock(FormattedBlock):
             CodeBlock: This CodeBlock.
         """
         if isinstance(codeblock, str):
-            self.statements.extend(Statement(codeblock))
-        elif isinstance(codeblock, CodeBlock):
-            self.statements.extend(codeblock)
+            # A new Statement has no other parent to check for.
+            codeblock = Statement(codeblock)
+            codeblock._parents = weakref.ref(self)
         else:
-            raise TypeError("codeblock should be of type CodeBlock or str.")
+            if __debug__ and not isinstance(codeblock, CodeBlock):
+                raise TypeError("codeblock should be of type CodeBlock or str.")
+            codeblock._add_parent(self)
+        self._statements.append(codeblock)
+        if self._in_cache:
+            self._invalidate()
         return self
 
+    def _children(self):
+        """The docstring and body blocks of this CodeBlock.
+
+        Returns:
+            list(FormattedBlock): The child blocks.
+        """
+        children = [stmnt for stmnt in self._statements
+                    if isinstance(stmnt, FormattedBlock)]
+        if self._docstring is not None:
+            children.append(self._docstring)
+        return children
+
     def _to_lines(self):
         """Convert this CodeBlock to an array of code lines.
 
+        The lines are rendered once and reused until this CodeBlock changes.
+
         Returns:
             list(str): The lines of code making up this CodeBlock.
         """
-        lines = [self._entry(),]
-        if self.docstring:
-            lines.extend('    ' + l for l in list(self._docstring))
-        for stmnt in self.statements:
-            lines.append('    ' + stmnt)
-        if self.return_stmnt:
-            lines.append('    ' + self.return_stmnt)
-        return lines
+        if self._lines_cache is None:
+            self._lines_cache = list(self._iter_lines())
+        return self._lines_cache
+
+    def _iter_lines(self, indent=''):
+        """Generate the code lines of this CodeBlock.
+
+        Nested blocks are walked with an explicit stack rather than by
+        recursion, so deeply nested trees do not run into the recursion limit.
+
+        Args:
+            indent (str, optional): Prefix for the entry line of this block.
+
+        Yields:
+            str: Each line of code, already indented.
+        """
+        stack = [(indent, self)]
+        while stack:
+            prefix, item = stack.pop()
+            if isinstance(item, str):
+                yield prefix + item
+                continue
+            item._in_cache = True
+            yield prefix + item._entry()
+            if (not item._statements and item._docstring is None
+                    and not item._return_stmnt):
+                # Leaf blocks, mostly plain Statements, have no body to walk.
+                continue
+            sub = prefix + item._body_indent
+            if item._return_stmnt:
+                stack.append((sub, item._return_stmnt))
+            stack.extend((sub, stmnt) for stmnt in reversed(item._statements))
+            if item._docstring is not None:
+                doc = '\n'.join(item._docstring._to_lines())
+                yield from textwrap.indent(doc, sub).split('\n')
 
 
 class DocString(FormattedBlock):
@@ -153,6 +438,8 @@ class DocString(FormattedBlock):
         >>> print('\n'.join(ds.to_lines()))
     """
 
+    __slots__ = ('_name', '_description', '_returns', '_args')
+
     def __init__(self, name, description=None, returns=None, *args):
         """Initialize a DocString.
 
@@ -163,35 +450,104 @@ class DocString(FormattedBlock):
             *args (list(str), optional): Any arguments documented in the docstring.
         """
         super().__init__()
-        self.name = name
-        self.description = description
-        self.returns = returns
-        self.args = args
+        self._name = name
+        self._description = description
+        self._returns = returns
+        self._args = args
+
+    @property
+    def name(self):
+        """Get the opening line of this DocString."""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Set the opening line of this DocString.
+
+        Args:
+            name (str): The opening line of the docstring.
+        """
+        self._name = name
+        self._invalidate()
+
+    @property
+    def description(self):
+        """Get the description line of this DocString."""
+        return self._description
+
+    @description.setter
+    def description(self, description):
+        """Set the description line of this DocString.
+
+        Args:
+            description (str): The description line, or None for none.
+        """
+        self._description = description
+        self._invalidate()
+
+    @property
+    def returns(self):
+        """Get the return doc of this DocString."""
+        return self._returns
+
+    @returns.setter
+    def returns(self, returns):
+        """Set the return doc of this DocString.
+
+        Args:
+            returns (str): The return doc, or None for none.
+        """
+        self._returns = returns
+        self._invalidate()
+
+    @property
+    def args(self):
+        """Get the arguments documented in this DocString."""
+        return self._args
+
+    @args.setter
+    def args(self, args):
+        """Set the arguments documented in this DocString.
+
+        Args:
+            args (list(str)): The documented arguments.
+        """
+        self._args = tuple(args)
+        self._invalidate()
 
     def _to_lines(self):
         """Convert this DocString to a list of lines of code.
 
+        The lines are built once and reused until this DocString changes.
+
         Returns:
             list(str): The DocString as a list of code lines.
         """
-        lines = ['"""%s' % self.name,]
-        if self.description:
-            lines.append('\n' + self.description)
-        if self.args:
-            lines.append('\nArgs:')
-            for arg in self.args:
-                lines.append('    %s ():' % arg)
-            lines.append(lines.pop() + '\n')
-        if self.returns:
+        if self._lines_cache is not None:
+            return self._lines_cache
+        lines = [f'"""{self._name}',]
+        if self._description:
+            lines.append('')
+            lines.append(self._description)
+        if self._args:
+            lines.append('')
+            lines.append('Args:')
+            lines.extend([f'    {arg} ():' for arg in self._args])
+            lines.append('')
+        if self._returns:
             lines.append('Returns:')
-            lines.append('    %s:' % self.returns)
+            lines.append(f'    {self._returns}:')
         lines.append('"""')
+        self._lines_cache = lines
+        self._in_cache = True
         return lines
 
 
 class Statement(CodeBlock):
     """A Python statement."""
 
+    __slots__ = ('statement',)
+
     def __init__(self, stmnt):
         """Initialize a Statement.
 
@@ -213,6 +569,8 @@ class Statement(CodeBlock):
 class If(CodeBlock):
     """CodeBlock representing an if conditional."""
 
+    __slots__ = ('_expression', '_entry_str')
+
     def __init__(self, expression):
         """Initialize an If block.
 
@@ -220,7 +578,20 @@ class If(CodeBlock):
             expression (str): The expression to evaluate for this If.
         """
         super().__init__()
-        self.expression = expression
+        self._expression = expression
+        self._entry_str = f"if {expression}:"
+
+    @property
+    def expression(self):
+        """Get the expression evaluated by this If."""
+        return self._expression
+
+    @expression.setter
+    def expression(self, expression):
+        """Set the expression evaluated by this If."""
+        self._expression = expression
+        self._entry_str = f"if {expression}:"
+        self._invalidate()
 
     def _entry(self):
         """Enter an If conditional.
@@ -228,12 +599,14 @@ class If(CodeBlock):
         Returns:
             str: Of form, 'if <expression>:'
         """
-        return "if %s:" % self.expression
+        return self._entry_str
 
 
 class ElIf(CodeBlock):
     """CodeBlock representing an elif conditional."""
 
+    __slots__ = ('_expression', '_entry_str')
+
     def __init__(self, expression):
         """Initialize an ElIf block.
 
@@ -241,7 +614,20 @@ class ElIf(CodeBlock):
             expression (str): The expression to evaluate for this ElIf.
         """
         super().__init__()
-        self.expression = expression
+        self._expression = expression
+        self._entry_str = f"elif {expression}:"
+
+    @property
+    def expression(self):
+        """Get the expression evaluated by this ElIf."""
+        return self._expression
+
+    @expression.setter
+    def expression(self, expression):
+        """Set the expression evaluated by this ElIf."""
+        self._expression = expression
+        self._entry_str = f"elif {expression}:"
+        self._invalidate()
 
     def _entry(self):
         """Enter an ElIf conditional.
@@ -249,15 +635,13 @@ class ElIf(CodeBlock):
         Returns:
             str: Of form, 'elif <expression>:'
         """
-        return "elif %s:" % self.expression
+        return self._entry_str
 
 
 class Else(CodeBlock):
     """CodeBlock representing an else conditional."""
 
-    def __init__(self):
-        """Initialize an Else block."""
-        super().__init__()
+    __slots__ = ()
 
     def _entry(self):
         """Enter an Else conditional.
@@ -271,6 +655,8 @@ class Else(CodeBlock):
 class ForLoop(CodeBlock):
     """CodeBlock representing a for loop."""
 
+    __slots__ = ('_index', '_iterable', '_entry_str')
+
     def __init__(self, index, iterable):
         """Initialize a ForLoop block.
 
@@ -279,8 +665,33 @@ class ForLoop(CodeBlock):
             iterable (str): The name of the iterable variable.
         """
         super().__init__()
-        self.index = index
-        self.iterable = iterable
+        self._index = index
+        self._iterable = iterable
+        self._entry_str = f"for {index} in {iterable}:"
+
+    @property
+    def index(self):
+        """Get the name of the index variable(s)."""
+        return self._index
+
+    @index.setter
+    def index(self, index):
+        """Set the name of the index variable(s)."""
+        self._index = index
+        self._entry_str = f"for {index} in {self._iterable}:"
+        self._invalidate()
+
+    @property
+    def iterable(self):
+        """Get the name of the iterable variable."""
+        return self._iterable
+
+    @iterable.setter
+    def iterable(self, iterable):
+        """Set the name of the iterable variable."""
+        self._iterable = iterable
+        self._entry_str = f"for {self._index} in {iterable}:"
+        self._invalidate()
 
     def _entry(self):
         """Enter a for loop.
@@ -288,12 +699,14 @@ class ForLoop(CodeBlock):
         Returns:
             str: Of form, 'for <index> in <iterable>:'
         """
-        return "for %s in %s:" % (self.index, self.iterable)
+        return self._entry_str
 
 
 class WhileLoop(CodeBlock):
     """CodeBlock representing a while loop."""
 
+    __slots__ = ('_expression', '_entry_str')
+
     def __init__(self, expression):
         """Initialize a WhileLoop block.
 
@@ -301,7 +714,20 @@ class WhileLoop(CodeBlock):
             expression (str): The expression to evaluate in the while loop.
         """
         super().__init__()
-        self.expression = expression
+        self._expression = expression
+        self._entry_str = f"while {expression}:"
+
+    @property
+    def expression(self):
+        """Get the expression evaluated by this while loop."""
+        return self._expression
+
+    @expression.setter
+    def expression(self, expression):
+        """Set the expression evaluated by this while loop."""
+        self._expression = expression
+        self._entry_str = f"while {expression}:"
+        self._invalidate()
 
     def _entry(self):
         """Enter a while loop.
@@ -309,12 +735,14 @@ class WhileLoop(CodeBlock):
         Returns:
             str: Of form, 'while <expression>:'
         """
-        return "while %s:" % self.expression
+        return self._entry_str
 
 
 class Define(CodeBlock):
     """CodeBlock representing a define block."""
 
+    __slots__ = ('_name', '_params', '_entry_str')
+
     def __init__(self, name, *params):
         """Initialize a Define block.
 
@@ -323,8 +751,37 @@ class Define(CodeBlock):
             params (list(str)): Any parameters to the defined func/method.
         """
         super().__init__()
-        self.name = name
-        self.params = params
+        self._name = name
+        self._params = params
+        self._entry_str = f"def {name}({', '.join(params)}):"
+
+    @property
+    def name(self):
+        """Get the name of the defined func/method."""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Set the name of the defined func/method."""
+        self._name = name
+        self._entry_str = f"def {name}({', '.join(self._params)}):"
+        self._invalidate()
+
+    @property
+    def params(self):
+        """Get the parameters of the defined func/method."""
+        return self._params
+
+    @params.setter
+    def params(self, params):
+        """Set the parameters of the defined func/method.
+
+        Args:
+            params (list(str)): The new parameters.
+        """
+        self._params = tuple(params)
+        self._entry_str = f"def {self._name}({', '.join(self._params)}):"
+        self._invalidate()
 
     def _entry(self):
         """Enter a define block.
@@ -332,7 +789,7 @@ class Define(CodeBlock):
         Returns:
             str: Of form, 'def <name>(<param1>, <param2>, ...):'
         """
-        return "def %s(%s):" % (self.name, ', '.join(self.params))
+        return self._entry_str
 
     def returns(self, what):
         """Set a return value for the defined func/method.
@@ -343,13 +800,15 @@ class Define(CodeBlock):
         Returns:
             CodeBlock: this codeblock.
         """
-        self.return_stmnt = "return %s" % what
+        self.return_stmnt = f"return {what}"
         return self
 
 
 class Class(CodeBlock):
     """CodeBlock representing a class."""
 
+    __slots__ = ('_name', '_extends', '_entry_str')
+
     def __init__(self, name, *extends):
         """Initialize a Class block.
 
@@ -358,8 +817,37 @@ class Class(CodeBlock):
             extends (list(str)): Any classes this class inherits from.
         """
         super().__init__()
-        self.name = name
-        self.extends = extends if extends else ["object",]
+        self._name = name
+        self._extends = extends or _DEFAULT_EXTENDS
+        self._entry_str = f"class {name}({', '.join(self._extends)}):"
+
+    @property
+    def name(self):
+        """Get the name of the class."""
+        return self._name
+
+    @name.setter
+    def name(self, name):
+        """Set the name of the class."""
+        self._name = name
+        self._entry_str = f"class {name}({', '.join(self._extends)}):"
+        self._invalidate()
+
+    @property
+    def extends(self):
+        """Get the classes this class inherits from."""
+        return self._extends
+
+    @extends.setter
+    def extends(self, extends):
+        """Set the classes this class inherits from.
+
+        Args:
+            extends (list(str)): The new base classes, empty for object.
+        """
+        self._extends = tuple(extends) or _DEFAULT_EXTENDS
+        self._entry_str = f"class {self._name}({', '.join(self._extends)}):"
+        self._invalidate()
 
     def _entry(self):
         """Enter a class block.
@@ -367,12 +855,16 @@ class Class(CodeBlock):
         Returns:
             str: Of form, 'class <name>(<extend1>, <extend2>, ...):'
         """
-        return "class %s(%s):" % (self.name, ', '.join(self.extends))
+        return self._entry_str
 
 
 class Module(CodeBlock):
     """Object representing a Python module."""
 
+    __slots__ = ('name',)
+
+    _body_indent = ''
+
     def __init__(self, name, docstring=None):
         """Initialize a PythonFile object.
 
@@ -383,7 +875,7 @@ class Module(CodeBlock):
         """
         super().__init__()
         self.name = name
-        if docstring:
+        if docstring is not None:
             self.docstring = docstring
         else:
             self.docstring = DocString(name)
@@ -391,25 +883,22 @@ class Module(CodeBlock):
     def _entry(self):
         return ''
 
-    def _to_lines(self):
-        """Convert this CodeBlock to an array of code lines.
+    def raw_str(self):
+        """The unformatted code of this Module, without running YAPF.
+
+        A Module is the root of its tree, so its lines are streamed into the
+        join rather than kept alongside the formatted code.
 
         Returns:
-            list(str): The lines of code making up this CodeBlock.
+            str: The code lines joined with newlines.
         """
-        lines = [self._entry(),]
-        if self.docstring:
-            lines.extend(l for l in list(self._docstring))
-        for stmnt in self.statements:
-            lines.append(stmnt)
-        if self.return_stmnt:
-            lines.append(self.return_stmnt)
-        return lines
+        return '\n'.join(self._iter_lines())
 
     def write(self, dir_path=None):
         """Write this Module out to a file.
 
         Writes to the current working directory or a given directory path.
+        The module source is formatted in memory and written out once.
 
         Args:
             dir_path (str): Write this module file to a specific directory.
@@ -419,4 +908,3 @@ class Module(CodeBlock):
             out_path = os.path.join(dir_path, out_path)
         with open(out_path, 'w') as py_fp:
             py_fp.write(str(self))
-        yapf.yapf_api.FormatFile(out_path, in_place=True)
@@ -1,6 +1,10 @@
 import unittest
 
+import copy
+import gc
 import os
+import pickle
+from unittest import mock
 
 import pypoet
 
@@ -25,16 +29,84 @@ class TestCodeBlock(unittest.TestCase):
             self.fail('expected a TypeError')
         except TypeError:
             pass
+        self.assertIs(cb.docstring, doc)
+        self.assertEqual(doc._live_parents(), [cb])
 
     def test_append(self):
         cbother = pypoet.CodeBlock()
         cb = pypoet.CodeBlock()
+        cb.append(cbother)
+        self.assertIs(cb.statements[0], cbother)
         try:
-            cb.append(cbother)
+            cb._to_lines()
             self.fail('expected NotImplementedError')
         except NotImplementedError:
             pass
 
+    def test_parents(self):
+        stmnt = pypoet.Statement('pass')
+        parent = pypoet.If('x').append(stmnt).append(stmnt)
+        self.assertEqual(stmnt._live_parents(), [parent])
+        other = pypoet.If('y').append(stmnt)
+        self.assertEqual(len(stmnt._live_parents()), 2)
+        del parent, other
+        gc.collect()
+        self.assertEqual(stmnt._live_parents(), [])
+        for _ in range(100):
+            pypoet.If('x').append(stmnt)
+        self.assertLessEqual(len(stmnt._parents), 16)
+
+    def test_shared_child_invalidate(self):
+        node = bottom = pypoet.If('x')
+        for _ in range(40):
+            node = pypoet.If('x').append(node).append(node)
+        bottom.append('pass')
+        node = bottom = pypoet.If('x')
+        for _ in range(10):
+            node = pypoet.If('x').append(node).append(node)
+        self.assertEqual(len(node._to_lines()), 2 ** 11 - 1)
+        bottom.append('pass')
+        self.assertEqual(len(node._to_lines()), 2 ** 11 - 1 + 2 ** 10)
+
+    def test_statements(self):
+        old = pypoet.Statement('x = 1')
+        if_ = pypoet.If('x').append(old)
+        self.assertEqual(if_._to_lines(), ['if x:', '    x = 1'])
+        if_.statements = ['pass', pypoet.Statement('y = 2')]
+        self.assertEqual(if_._to_lines(), ['if x:', '    pass', '    y = 2'])
+        self.assertEqual(old._live_parents(), [])
+        try:
+            if_.statements = [5]
+            self.fail('expected a TypeError')
+        except TypeError:
+            pass
+        self.assertEqual(if_._to_lines(), ['if x:', '    pass', '    y = 2'])
+        self.assertEqual(if_.statements[1]._live_parents(), [if_])
+
+    def test_pickle(self):
+        inner = pypoet.If('y').append('pass')
+        outer = pypoet.If('x').append(inner)
+        outer.docstring = pypoet.DocString('doc')
+        str(outer)
+        copied = pickle.loads(pickle.dumps(outer))
+        self.assertEqual(copied.raw_str(), outer.raw_str())
+        copied.statements[0].append('x = 1')
+        self.assertIn('x = 1', copied.raw_str())
+
+    def test_deepcopy(self):
+        inner = pypoet.If('y').append('pass')
+        outer = pypoet.If('x').append(inner)
+        outer.docstring = pypoet.DocString('doc')
+        str(outer)
+        copied = copy.deepcopy(outer)
+        str(copied)
+        copied.statements[0].append('x = 1')
+        copied.docstring.description = 'copied'
+        self.assertIn('x = 1', str(copied))
+        self.assertIn('copied', copied.raw_str())
+        self.assertNotIn('x = 1', str(outer))
+        self.assertNotIn('copied', outer.raw_str())
+
     def test_to_lines(self):
         cb = pypoet.CodeBlock()
         try:
@@ -44,6 +116,25 @@ class TestCodeBlock(unittest.TestCase):
             pass
 
 
+class TestSlots(unittest.TestCase):
+
+    def test_no_instance_dict(self):
+        blocks = [
+            pypoet.DocString('docstring'),
+            pypoet.Statement('pass'),
+            pypoet.If('x'),
+            pypoet.ElIf('x'),
+            pypoet.Else(),
+            pypoet.ForLoop('cat', 'cats'),
+            pypoet.WhileLoop('x'),
+            pypoet.Define('foo'),
+            pypoet.Class('Cat'),
+            pypoet.Module('test'),
+        ]
+        for block in blocks:
+            self.assertFalse(hasattr(block, '__dict__'), type(block).__name__)
+
+
 class TestDocString(unittest.TestCase):
 
     def test_to_lines(self):
@@ -69,6 +160,19 @@ class TestDocString(unittest.TestCase):
             ''
         ]
         self.assertEqual(list(ds), exp_lines)
+        self.assertEqual(len(ds), len(exp_lines))
+
+    def test_change_invalidates(self):
+        define = pypoet.Define('f').returns('1')
+        define.docstring = pypoet.DocString('f')
+        ds = define.docstring
+        self.assertNotIn('changed', str(define))
+        ds.description = 'changed'
+        self.assertIn('changed', str(ds))
+        self.assertIn('changed', str(define))
+        define.docstring = pypoet.DocString('g')
+        ds.description = 'again'
+        self.assertNotIn('again', str(define))
 
 
 class TestStatement(unittest.TestCase):
@@ -77,6 +181,17 @@ class TestStatement(unittest.TestCase):
         stmnt = pypoet.Statement('print("CATS")')
         self.assertEqual(stmnt._entry(), 'print("CATS")')
 
+    def test_raw_str(self):
+        stmnt = pypoet.Statement('x=5')
+        self.assertEqual(stmnt.raw_str(), 'x=5')
+        self.assertEqual(str(stmnt), 'x = 5\n')
+        self.assertEqual(stmnt, pypoet.Statement('x = 5'))
+
+    def test_contains(self):
+        stmnt = pypoet.Statement('print("CATS")')
+        self.assertIn('CATS', stmnt)
+        self.assertNotIn('DOGS', stmnt)
+
 
 class TestIf(unittest.TestCase):
 
@@ -84,12 +199,38 @@ class TestIf(unittest.TestCase):
         if_ = pypoet.If('x == 5')
         self.assertEqual(if_._entry(), 'if x == 5:')
 
+    def test_reassign(self):
+        if_ = pypoet.If('x').append('pass')
+        define = pypoet.Define('check').append(if_)
+        self.assertEqual(str(define), 'def check():\n    if x:\n        pass\n')
+        if_.expression = 'y'
+        self.assertEqual(if_.expression, 'y')
+        self.assertEqual(str(define), 'def check():\n    if y:\n        pass\n')
+
+    def test_nested_format_once(self):
+        inner = pypoet.If('y').append('pass')
+        outer = pypoet.If('x').append(inner)
+        self.assertEqual(str(outer), 'if x:\n    if y:\n        pass\n')
+        self.assertIsNone(inner._cached_str)
+
+    def test_deep_nesting(self):
+        root = block = pypoet.If('x')
+        for _ in range(2000):
+            child = pypoet.If('x')
+            block.append(child)
+            block = child
+        lines = root._to_lines()
+        self.assertEqual(len(lines), 2001)
+        self.assertEqual(lines[-1], '    ' * 2000 + 'if x:')
+
 
 class TestElIf(unittest.TestCase):
 
     def test_entry(self):
         elif_ = pypoet.ElIf('x == 6')
         self.assertEqual(elif_._entry(), 'elif x == 6:')
+        elif_.expression = 'x == 7'
+        self.assertEqual(elif_._entry(), 'elif x == 7:')
 
 
 class TestElse(unittest.TestCase):
@@ -105,12 +246,22 @@ class TestForLoop(unittest.TestCase):
         forloop = pypoet.ForLoop('cat', 'cats')
         self.assertEqual(forloop._entry(), 'for cat in cats:')
 
+    def test_reassign(self):
+        forloop = pypoet.ForLoop('cat', 'cats')
+        define = pypoet.Define('pet').append(forloop)
+        self.assertEqual(define._to_lines(), ['def pet():', '    for cat in cats:'])
+        forloop.index = 'kitten'
+        forloop.iterable = 'kittens'
+        self.assertEqual(define._to_lines(), ['def pet():', '    for kitten in kittens:'])
+
 
 class TestWhileLoop(unittest.TestCase):
 
     def test_entry(self):
         whileloop = pypoet.WhileLoop('len(cats) > 100')
         self.assertEqual(whileloop._entry(), 'while len(cats) > 100:')
+        whileloop.expression = 'cats'
+        self.assertEqual(whileloop._entry(), 'while cats:')
 
 
 class TestDefine(unittest.TestCase):
@@ -119,10 +270,40 @@ class TestDefine(unittest.TestCase):
         define = pypoet.Define('add_cat', 'cat_name', 'cat_length', 'alive=True')
         self.assertEqual(define._entry(), 'def add_cat(cat_name, cat_length, alive=True):')
 
+    def test_reassign(self):
+        define = pypoet.Define('add_cat', 'cat_name')
+        self.assertEqual(define._to_lines(), ['def add_cat(cat_name):'])
+        define.name = 'add_dog'
+        define.params = ['dog_name', 'alive=True']
+        self.assertEqual(define.params, ('dog_name', 'alive=True'))
+        self.assertEqual(define._to_lines(), ['def add_dog(dog_name, alive=True):'])
+
     def test_returns(self):
         define = pypoet.Define('cat_face').returns("':3'")
         self.assertEqual(define.return_stmnt, "return ':3'")
 
+    def test_nested_append(self):
+        if_ = pypoet.If('face')
+        define = pypoet.Define('cat_face').append(if_)
+        self.assertEqual(define._to_lines(), ['def cat_face():', '    if face:'])
+        if_.append('print(face)')
+        self.assertEqual(define._to_lines(),
+                         ['def cat_face():', '    if face:', '        print(face)'])
+
+    def test_str_invalidated(self):
+        body = pypoet.If('happy').append('purr()')
+        define = pypoet.Define('cat_face').append(body)
+        self.assertEqual(str(define), 'def cat_face():\n    if happy:\n        purr()\n')
+        body.append('blink()')
+        self.assertIn('blink()', str(define))
+
+    def test_to_lines_invalidated(self):
+        define = pypoet.Define('cat_face')
+        self.assertEqual(define._to_lines(), ['def cat_face():'])
+        define.append('face = ":3"').returns('face')
+        self.assertEqual(define._to_lines(),
+                         ['def cat_face():', '    face = ":3"', '    return face'])
+
 
 class TestClass(unittest.TestCase):
 
@@ -130,6 +311,26 @@ class TestClass(unittest.TestCase):
         class_ = pypoet.Class('Cat', 'DomesticMammal')
         self.assertEqual(class_._entry(), 'class Cat(DomesticMammal):')
 
+    def test_reassign(self):
+        class_ = pypoet.Class('Cat', 'DomesticMammal')
+        module = pypoet.Module('cats').append(class_)
+        self.assertIn('class Cat(DomesticMammal):', module.raw_str())
+        class_.name = 'Kitten'
+        class_.extends = ()
+        self.assertIn('class Kitten(object):', module.raw_str())
+
+    def test_docstring_indent(self):
+        class_ = pypoet.Class('Cat')
+        class_.docstring = pypoet.DocString('Cat', 'A cat.')
+        self.assertEqual(class_._to_lines(),
+                         ['class Cat(object):', '    """Cat', '', '    A cat.', '    """'])
+
+    def test_docstring_format_once(self):
+        class_ = pypoet.Class('Cat').append('pass')
+        class_.docstring = pypoet.DocString('Cat')
+        self.assertIn('"""Cat', str(class_))
+        self.assertIsNone(class_.docstring._cached_str)
+
 
 class TestPythonFile(unittest.TestCase):
 
@@ -140,6 +341,18 @@ class TestPythonFile(unittest.TestCase):
     def test_default_docstring(self):
         pyfile = pypoet.Module('test')
         self.assertEqual(pyfile.docstring, pypoet.DocString('test'))
+        other = pypoet.Module('test')
+        self.assertIsNot(other.docstring, pyfile.docstring)
+        pyfile.docstring.description = 'only pyfile'
+        self.assertNotIn('only pyfile', other.raw_str())
+
+    def test_eq_formatted(self):
+        pyfile = pypoet.Module('test').append('x=5')
+        other = pypoet.Module('test').append('x = 5')
+        str(pyfile)
+        str(other)
+        with mock.patch.object(pypoet.Module, '_iter_lines', side_effect=AssertionError):
+            self.assertEqual(pyfile, other)
 
     def test_write(self):
         pyfile = pypoet.Module('test')